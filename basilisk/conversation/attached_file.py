@@ -15,6 +15,7 @@ from PIL import Image
 from pydantic import (
 	BaseModel,
 	Field,
+	PrivateAttr,
 	SerializationInfo,
 	SerializerFunctionWrapHandler,
 	ValidationInfo,
@@ -223,6 +224,7 @@ class AttachmentFile(BaseModel):
 	description: str | None = None
 	size: int | None = None
 	mime_type: str | None = None
+	_base64_cache: tuple[UPath, str] | None = PrivateAttr(default=None)
 
 	@field_serializer("location", mode="wrap")
 	@classmethod
@@ -416,11 +418,18 @@ class AttachmentFile(BaseModel):
 	def encode_base64(self) -> str:
 		"""Encode the file as a base64 string.
 
+		The result is cached for the location it was read from, so that an attachment resent with every message of a conversation is only encoded once.
+
 		Returns:
 			A base64-encoded string representing the file.
 		"""
-		with self.send_location.open(mode="rb") as file:
-			return base64.b64encode(file.read()).decode("utf-8")
+		location = self.send_location
+		if self._base64_cache and self._base64_cache[0] == location:
+			return self._base64_cache[1]
+		with location.open(mode="rb") as file:
+			base64_data = base64.b64encode(file.read()).decode("ascii")
+		self._base64_cache = (location, base64_data)
+		return base64_data
 
 	def __del__(self):
 		"""Delete the file."""
@@ -521,6 +530,8 @@ class ImageFile(AttachmentFile):
 					format=self.location.suffix[1:],
 				)
 				self.resize_location = resize_location if success else None
+		# The resized file may have been rewritten at the same location
+		self._base64_cache = None
 
 	@measure_time
 	def encode_base64(self) -> str:
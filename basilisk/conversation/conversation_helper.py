@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+import time
 import zipfile
-from typing import TYPE_CHECKING, Any
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Any, Iterator
 
-from fsspec.implementations.zip import ZipFileSystem
 from pydantic import ValidationInfo
 from upath import UPath
 
@@ -22,27 +24,100 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Size of the chunks used to stream attachments in and out of bskc archives
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Deflate level of compressed bskc entries, favoring save speed over size
+ZIP_COMPRESS_LEVEL = 1
+
+# MIME types other than text/* that are worth compressing in a bskc archive
+COMPRESSIBLE_MIME_TYPES = {
+	"application/javascript",
+	"application/json",
+	"application/xml",
+	"image/bmp",
+	"image/svg+xml",
+}
+
 PROMPT_TITLE = "Generate a concise, relevant title in the conversation's main language based on the topics and context. Max 70 characters. Do not surround the text with quotation marks."
 
 
+@contextmanager
+def open_bskc_stream(
+	file: str | os.PathLike | IO[bytes], mode: str
+) -> Iterator[IO[bytes]]:
+	"""Open a bskc file from a path, or use an already opened binary file object as is.
+
+	Args:
+		file: The path of the bskc file, or a binary file object such as BytesIO.
+		mode: The binary mode used to open the file when a path is given.
+
+	Yields:
+		A binary file object for the bskc file.
+	"""
+	if isinstance(file, (str, os.PathLike)):
+		with open(file, mode=mode) as bskc_file:
+			yield bskc_file
+	else:
+		yield file
+
+
+def is_compressible(mime_type: str | None) -> bool:
+	"""Check whether a file is worth compressing in a bskc archive.
+
+	Text based files are compressed. Other files, such as images or PDF documents, are usually already compressed: deflating them again costs CPU time for almost no size reduction, so they are stored as is.
+
+	Args:
+		mime_type: The MIME type of the file.
+
+	Returns:
+		True if the file should be deflated, False if it should be stored.
+	"""
+	return bool(mime_type) and (
+		mime_type.startswith("text/") or mime_type in COMPRESSIBLE_MIME_TYPES
+	)
+
+
+def open_zip_entry(
+	zip_file: zipfile.ZipFile, name: str, mime_type: str | None
+) -> IO[bytes]:
+	"""Open a new file for writing in a zip archive, compressed according to its MIME type.
+
+	Compressible files use the compression of the archive, deflate at level 1 for bskc files (see create_bskc_file). Other files are stored.
+
+	Args:
+		zip_file: The zip archive opened for writing.
+		name: The name of the file within the zip archive.
+		mime_type: The MIME type of the file.
+
+	Returns:
+		A writable binary file object for the new zip entry.
+	"""
+	if is_compressible(mime_type):
+		return zip_file.open(name, mode="w", force_zip64=True)
+	zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+	zip_info.compress_type = zipfile.ZIP_STORED
+	return zip_file.open(zip_info, mode="w", force_zip64=True)
+
+
 def save_attachments(
 	attachments: list[ImageFile | AttachmentFile],
 	attachment_path: str,
-	fs: ZipFileSystem,
+	zip_file: zipfile.ZipFile,
 ) -> dict[UPath, str]:
-	"""Save image attachments to a specified path within a zip file system.
+	"""Save image attachments to a specified path within a zip file.
 
 	This function copies image attachments from their original locations to a new location
-	in a zip file system, skipping URL-based images. It creates a mapping of original
+	in a zip file, skipping URL-based images. It creates a mapping of original
 	attachment locations to their new locations within the zip file.
 
 	Args:
 		attachments: A list of image file attachments to be saved.
-		attachment_path: The base path within the zip file system where attachments will be stored.
-		fs: The zip file system where attachments will be copied.
+		attachment_path: The base path within the zip file where attachments will be stored.
+		zip_file: The zip file where attachments will be copied.
 
 	Returns:
-		A mapping of original attachment locations to their new locations in the zip file system.
+		A mapping of original attachment locations to their new locations in the zip file.
 	"""
 	attachment_mapping = {}
 	for attachment in attachments:
@@ -50,20 +125,26 @@ def save_attachments(
 			continue
 		new_location = f"{attachment_path}/{attachment.location.name}"
 		with attachment.location.open(mode="rb") as attachment_file:
-			with fs.open(new_location, mode="wb") as new_file:
-				shutil.copyfileobj(attachment_file, new_file)
+			with open_zip_entry(
+				zip_file, new_location, attachment.mime_type
+			) as new_file:
+				shutil.copyfileobj(
+					attachment_file, new_file, length=COPY_BUFFER_SIZE
+				)
 		attachment_mapping[attachment.location] = new_location
 	return attachment_mapping
 
 
-def create_conv_main_file(conversation: Conversation, fs: ZipFileSystem):
+def create_conv_main_file(
+	conversation: Conversation, zip_file: zipfile.ZipFile
+):
 	"""Create the main conversation file within a zip archive.
 
 	This function processes a conversation by saving its attachments and writing the conversation data to a JSON file. It handles multiple messages with attachments, creating a mapping of original to new attachment locations.
 
 	Args:
 		conversation: The conversation object to be saved
-		fs: The zip file system where the conversation will be stored
+		zip_file: The zip file where the conversation will be stored
 	"""
 	base_path = "attachments"
 	attachment_mapping = {}
@@ -71,14 +152,18 @@ def create_conv_main_file(conversation: Conversation, fs: ZipFileSystem):
 		attachments = block.request.attachments
 		if not attachments:
 			continue
-		fs.makedirs(base_path, exist_ok=True)
-		attachment_mapping |= save_attachments(attachments, base_path, fs)
-	with fs.open("conversation.json", mode="w", encoding="utf-8") as conv_file:
-		conv_file.write(
-			conversation.model_dump_json(
-				context={"attachment_mapping": attachment_mapping}
-			)
-		)
+		attachment_mapping |= save_attachments(attachments, base_path, zip_file)
+	zip_info = zipfile.ZipInfo(
+		"conversation.json", date_time=time.localtime()[:6]
+	)
+	zip_file.writestr(
+		zip_info,
+		conversation.model_dump_json(
+			context={"attachment_mapping": attachment_mapping}
+		),
+		compress_type=zipfile.ZIP_DEFLATED,
+		compresslevel=ZIP_COMPRESS_LEVEL,
+	)
 
 
 def restore_attachments(
@@ -98,7 +183,9 @@ def restore_attachments(
 		new_path = storage_path / attachment.location.name
 		with attachment.location.open(mode="rb") as attachment_file:
 			with new_path.open(mode="wb") as new_file:
-				shutil.copyfileobj(attachment_file, new_file)
+				shutil.copyfileobj(
+					attachment_file, new_file, length=COPY_BUFFER_SIZE
+				)
 		attachment.location = new_path
 		if not isinstance(attachment, ImageFile):
 			continue
@@ -131,7 +218,8 @@ def read_conv_main_file(
 	ValidationError: If the JSON data does not match the model class structure
 	"""
 	conversation = None
-	with conv_main_path.open(mode="r", encoding="utf-8") as conv_file:
+	# pydantic parses the raw UTF-8 bytes directly
+	with conv_main_path.open(mode="rb") as conv_file:
 		conversation = model_cls.model_validate_json(
 			json_data=conv_file.read(),
 			context={"root_path": conv_main_path.parent},
@@ -145,26 +233,32 @@ def read_conv_main_file(
 
 
 @measure_time
-def create_bskc_file(conversation: Conversation, file_path: str):
+def create_bskc_file(
+	conversation: Conversation, file_path: str | os.PathLike | IO[bytes]
+):
 	"""Save a conversation to a Basilisk Conversation (.bskc) file.
 
-	This function creates a Basilisk Conversation file by saving the conversation data and its attachments in a zip archive. The file is created with no compression to preserve the original file sizes.
+	This function creates a Basilisk Conversation file by saving the conversation data and its attachments in a zip archive. The conversation data and text attachments are deflated at level 1, which is much faster than the default level for a similar size, while already compressed attachments such as images are stored as is.
 
 	Args:
 		conversation: The conversation object to be saved
-		file_path: The file path where the Basilisk Conversation file will be created
+		file_path: The file path where the Basilisk Conversation file will be created, or a writable binary file object
 	"""
-	with open(file_path, mode="w+b") as bskc_file:
-		fs = ZipFileSystem(
-			fo=bskc_file, mode="w", compression=zipfile.ZIP_STORED
-		)
-		create_conv_main_file(conversation, fs)
-		fs.close()
+	with open_bskc_stream(file_path, mode="w+b") as bskc_file:
+		with zipfile.ZipFile(
+			bskc_file,
+			mode="w",
+			compression=zipfile.ZIP_DEFLATED,
+			compresslevel=ZIP_COMPRESS_LEVEL,
+		) as zip_file:
+			create_conv_main_file(conversation, zip_file)
 
 
 @measure_time
 def open_bskc_file(
-	model_cls: Conversation, file_path: str, base_storage_path: UPath
+	model_cls: Conversation,
+	file_path: str | os.PathLike | IO[bytes],
+	base_storage_path: UPath,
 ) -> Conversation:
 	"""Open a Basilisk Conversation file and restore its contents.
 
@@ -172,7 +266,7 @@ def open_bskc_file(
 
 	Args:
 		model_cls: The conversation model class used for instantiation
-		file_path: Path to the Basilisk Conversation file
+		file_path: Path to the Basilisk Conversation file, or a readable and seekable binary file object
 		base_storage_path: Base path where attachments will be restored
 
 	Returns:
@@ -182,7 +276,7 @@ def open_bskc_file(
 		zipfile.BadZipFile: If the file is not a valid zip archive
 		FileNotFoundError: If the conversation.json file is missing from the archive
 	"""
-	with open(file_path, mode="r+b") as bskc_file:
+	with open_bskc_stream(file_path, mode="r+b") as bskc_file:
 		if not zipfile.is_zipfile(bskc_file):
 			raise zipfile.BadZipFile("The baskc file must be a zip archive.")
 		zip_path = UPath("zip://", fo=bskc_file, mode="r")
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import enum
+import os
 from datetime import datetime
-from typing import Any
+from typing import IO, Any
 
 from pydantic import (
 	BaseModel,
@@ -292,11 +293,13 @@ class Conversation(BaseModel):
 					block.system_index -= 1
 
 	@classmethod
-	def open(cls, file_path: str, base_storage_path: UPath) -> Conversation:
+	def open(
+		cls, file_path: str | os.PathLike | IO[bytes], base_storage_path: UPath
+	) -> Conversation:
 		"""Open a conversation from a file at the specified path.
 
 		Args:
-			file_path: The path to the conversation file to be opened.
+			file_path: The path to the conversation file to be opened, or a binary file object containing it.
 			base_storage_path: The base storage path for the current conversation file.
 
 		Returns:
@@ -308,11 +311,11 @@ class Conversation(BaseModel):
 		"""
 		return open_bskc_file(cls, file_path, base_storage_path)
 
-	def save(self, file_path: str):
+	def save(self, file_path: str | os.PathLike | IO[bytes]):
 		"""Save the current conversation to a file.
 
 		Args:
-			file_path: The path where the conversation will be saved as a .bskc file.
+			file_path: The path where the conversation will be saved as a .bskc file, or a writable binary file object.
 
 		Raises:
 			IOError: If there is an error writing the file.
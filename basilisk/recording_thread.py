@@ -13,10 +13,7 @@ import threading
 import wave
 from typing import TYPE_CHECKING
 
-import sounddevice as sd
 import wx
-from numpy import append as np_append
-from numpy import array as np_array
 
 if TYPE_CHECKING:
 	from basilisk.config.main_config import RecordingsSettings
@@ -26,6 +23,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Sample width in bytes of the WAV file for each supported recording dtype
+SAMPLE_WIDTHS = {"uint8": 1, "int16": 2, "int24": 3, "int32": 4}
+
 
 class RecordingThread(threading.Thread):
 	"""Thread class for handling audio recording and transcription.
@@ -76,8 +76,16 @@ class RecordingThread(threading.Thread):
 		and processes it for transcription. Updates the GUI with status changes.
 		"""
 		if not self.audio_file_path:
+			dtype = self.recordings_settings.dtype
+			if dtype not in SAMPLE_WIDTHS:
+				log.error(f"Unsupported recording dtype: {dtype}")
+				wx.CallAfter(self.conversation_tab.stop_recording)
+				wx.CallAfter(
+					self.conversation_tab.on_transcription_error,
+					f"Unsupported recording dtype: {dtype}",
+				)
+				return
 			self.audio_file_path = self.get_filename()
-			self.audio_data = np_array([], dtype=self.recordings_settings.dtype)
 			log.debug("Recording started")
 			wx.CallAfter(self.conversation_tab.on_recording_started)
 			self.record_audio(self.recordings_settings.sample_rate)
@@ -101,37 +109,46 @@ class RecordingThread(threading.Thread):
 		Args:
 			sampleRate: The sample rate for audio recording.
 		"""
+		# Imported here since importing sounddevice initializes PortAudio, which is not needed to transcribe an existing audio file
+		import sounddevice as sd
+
 		chunk_size = 1024
+		# Raw frames of the whole recording
+		audio_data = bytearray()
 		self._recording = True
-		with sd.InputStream(
+		with sd.RawInputStream(
 			samplerate=sampleRate,
 			channels=self.recordings_settings.channels,
 			dtype=self.recordings_settings.dtype,
+			blocksize=chunk_size,
 		) as stream:
 			while not self._stop_record and self._recording:
 				frame, overflowed = stream.read(chunk_size)
 				if overflowed:
 					log.error("Audio buffer has overflowed.")
-				self.audio_data = np_append(self.audio_data, frame)
+				audio_data += frame
 				if self._want_abort:
 					break
 		self._recording = False
+		self.audio_data = audio_data
 
-	def save_wav(self, filename: str, data: np_array, sample_rate: int):
+	def save_wav(
+		self, filename: str, data: bytes | bytearray, sample_rate: int
+	):
 		"""Save recorded audio data to a WAV file.
 
 		Args:
 			filename: Path where the WAV file will be saved.
-			data: Audio data to be saved.
+			data: Raw audio frames to be saved.
 			sample_rate: Sample rate of the audio data.
 		"""
 		if self._want_abort:
 			return
 		wavefile = wave.open(filename, "wb")
 		wavefile.setnchannels(self.recordings_settings.channels)
-		wavefile.setsampwidth(2)  # 16 bits
+		wavefile.setsampwidth(SAMPLE_WIDTHS[self.recordings_settings.dtype])
 		wavefile.setframerate(sample_rate)
-		wavefile.writeframes(data.tobytes())
+		wavefile.writeframes(data)
 		wavefile.close()
 
 	def stop(self):
@@ -10,8 +10,10 @@ Supported formats are determined by the wx.adv.Sound capabilities.
 """
 
 import logging
+import os
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 
 import wx
@@ -21,19 +23,53 @@ from .global_vars import resource_path
 
 log = logging.getLogger(__name__)
 
-ALIASES = {
-	"chat_request_sent": resource_path
-	/ Path("sounds", "chat_request_sent.wav"),
-	"chat_response_pending": resource_path
-	/ Path("sounds", "chat_response_pending.wav"),
-	"chat_response_received": resource_path
-	/ Path("sounds", "chat_response_received.wav"),
-	"progress": resource_path / Path("sounds", "progress.wav"),
-	"recording_started": resource_path
-	/ Path("sounds", "recording_started.wav"),
-	"recording_stopped": resource_path
-	/ Path("sounds", "recording_stopped.wav"),
-}
+# Maximum number of loaded sounds kept in memory
+SOUND_CACHE_SIZE = 32
+# Number of threads used to preload the alias sounds
+PREWARM_WORKERS = 4
+
+
+@cache
+def get_aliases() -> dict[str, str]:
+	"""Return the mapping of sound aliases to sound file paths. Cache the result for future calls.
+
+	The paths are only built on first use instead of at import time. They are returned as strings since they are used as sound cache keys: hashing a string is much cheaper than hashing a Path on every play.
+
+	Returns:
+		A dictionary mapping each alias to its sound file path.
+	"""
+	sounds_path = resource_path / "sounds"
+	return {
+		"chat_request_sent": str(sounds_path / "chat_request_sent.wav"),
+		"chat_response_pending": str(sounds_path / "chat_response_pending.wav"),
+		"chat_response_received": str(
+			sounds_path / "chat_response_received.wav"
+		),
+		"progress": str(sounds_path / "progress.wav"),
+		"recording_started": str(sounds_path / "recording_started.wav"),
+		"recording_stopped": str(sounds_path / "recording_stopped.wav"),
+	}
+
+
+@lru_cache(maxsize=SOUND_CACHE_SIZE)
+def load_sound(file_path: str) -> wx.adv.Sound:
+	"""Load a sound file. Cache the result for future calls.
+
+	The cache is bounded since arbitrary sound files can be played, not only the aliases: the least recently played sounds are evicted first, which keeps the alias sounds loaded.
+
+	Args:
+		file_path: Path to the sound file
+
+	Returns:
+		Loaded wx.adv.Sound object
+
+	Raises:
+		IOError: If the sound file could not be loaded
+	"""
+	sound = wx.adv.Sound()
+	if not sound.Create(file_path):
+		raise IOError(f"Failed to load sound: {file_path}")
+	return sound
 
 
 class SoundManager:
@@ -47,18 +83,37 @@ class SoundManager:
 		"""Initialize the sound manager.
 
 		Sets up:
-		- Sound cache for efficient playback
-		- Threading support for looped playback
+		- Lock for thread-safe playback
 		- wx.adv.Sound player
+
+		The alias sounds are preloaded in a background thread so that their first playback does not have to load the file.
 		"""
 		self.current_sound = None
 		self.loop = False
-		self.loop_thread = None
 		self.sound_player = wx.adv.Sound()
 		self.thread_lock = threading.Lock()
-		self.sound_cache: dict[Path, wx.adv.Sound] = {}
+		threading.Thread(target=self._prewarm, daemon=True).start()
+
+	def _prewarm(self):
+		"""Load and cache all the alias sounds.
+
+		The sounds are loaded by a small thread pool so that the file reads overlap.
+		"""
+		with ThreadPoolExecutor(max_workers=PREWARM_WORKERS) as executor:
+			executor.map(self._preload_sound, get_aliases().values())
 
-	def _ensure_sound_loaded(self, file_path: Path) -> wx.adv.Sound:
+	def _preload_sound(self, file_path: str):
+		"""Load and cache a sound, logging a warning if it cannot be loaded.
+
+		Args:
+			file_path: Path to the sound file
+		"""
+		try:
+			self._ensure_sound_loaded(file_path)
+		except IOError as e:
+			log.warning(f"Failed to preload sound: {e}")
+
+	def _ensure_sound_loaded(self, file_path: str | Path) -> wx.adv.Sound:
 		"""Ensure that the sound file is loaded and cached.
 
 		Args:
@@ -70,27 +125,7 @@ class SoundManager:
 		Raises:
 			IOError: If the sound file could not be loaded
 		"""
-		if file_path in self.sound_cache:
-			return self.sound_cache[file_path]
-		sound = wx.adv.Sound()
-		if sound.Create(str(file_path)):
-			self.sound_cache[file_path] = sound
-		else:
-			raise IOError(f"Failed to load sound: {file_path}")
-		return sound
-
-	def _play_sound_loop(self, sound: wx.adv.Sound, delay: float = 0.1):
-		"""Play a sound in a loop until the loop flag is set to False.
-
-		Args:
-			sound: wx.adv.Sound object to play
-			delay: Delay in seconds between sound repetitions to prevent CPU overload (default: 0.1)
-		"""
-		while self.loop:
-			sound.Play(wx.adv.SOUND_ASYNC | wx.adv.SOUND_LOOP)
-			while self.loop:
-				time.sleep(delay)
-			sound.Stop()
+		return load_sound(os.fspath(file_path))
 
 	def play_sound(self, file_path: str, loop: bool = False):
 		"""Play a sound effect. If loop is True, the sound will be played in a loop.
@@ -99,30 +134,30 @@ class SoundManager:
 			file_path: Path to the sound file or a predefined alias from aliases mapping
 			loop: Whether to play the sound in a loop
 		"""
-		with self.thread_lock:
-			if file_path in ALIASES:
-				file_path = ALIASES[file_path]
+		file_path = get_aliases().get(file_path, file_path)
 
-			self.stop_sound()
+		# Loaded outside the lock so a cache miss does not serialize other play_sound calls
+		sound = self._ensure_sound_loaded(file_path)
 
-			sound = self._ensure_sound_loaded(file_path)
+		with self.thread_lock:
+			self.stop_sound()
 
+			self.current_sound = sound
 			self.loop = loop
 
+			flags = wx.adv.SOUND_ASYNC
 			if loop:
-				self.loop_thread = threading.Thread(
-					target=self._play_sound_loop, args=(sound,), daemon=True
-				)
-				self.loop_thread.start()
-			else:
-				sound.Play(wx.adv.SOUND_ASYNC)
+				flags |= wx.adv.SOUND_LOOP
+			sound.Play(flags)
 
 	def stop_sound(self):
-		"""Stop the currently playing sound effect."""
-		self.loop = False
-		if self.loop_thread is not None:
-			self.loop_thread.join(timeout=1)
-			self.loop_thread = None
+		"""Stop the currently playing looped sound effect.
+
+		The loop is played natively by wx.adv.Sound, so stopping it returns immediately instead of waiting for a loop thread to exit.
+		"""
+		if self.loop:
+			self.loop = False
+			wx.adv.Sound.Stop()
 
 
 def initialize_sound_manager():
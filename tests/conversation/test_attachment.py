@@ -138,6 +138,19 @@ class TestAttachmentFileProperties:
 		decoded = base64.b64decode(encoded).decode('utf-8')
 		assert decoded == "test content"
 
+	def test_attachment_base64_encoding_cache(self, text_file, tmp_path):
+		"""Test base64 encoding is cached until the location changes."""
+		attachment = AttachmentFile(location=text_file)
+		encoded = attachment.encode_base64()
+		assert attachment.encode_base64() is encoded
+
+		other_file = UPath(tmp_path) / "other.txt"
+		with other_file.open("w") as f:
+			f.write("other content")
+		attachment.location = other_file
+		decoded = base64.b64decode(attachment.encode_base64()).decode('utf-8')
+		assert decoded == "other content"
+
 
 class TestImageFileProperties:
 	"""Tests for image file properties and methods."""
@@ -241,6 +254,23 @@ class TestImageResizing:
 		else:
 			assert image.resize_location is None
 
+	def test_image_resize_invalidates_base64_cache(
+		self, resizable_image_file, conv_folder
+	):
+		"""Test base64 encoding is refreshed when the resized file is rewritten."""
+		image = ImageFile(location=resizable_image_file)
+		image.resize(conv_folder, max_width=50, max_height=25, quality=85)
+		encoded = image.encode_base64()
+
+		image.resize(conv_folder, max_width=40, max_height=20, quality=85)
+		assert image.resize_location == conv_folder / "optimized_images" / (
+			resizable_image_file.name
+		)
+		new_encoded = image.encode_base64()
+		assert new_encoded != encoded
+		decoded = base64.b64decode(new_encoded)
+		assert Image.open(BytesIO(decoded)).size == (40, 20)
+
 
 class TestURLAndFormatting:
 	"""Tests for URL handling and format parsing."""
@@ -129,9 +129,9 @@ class TestBSKCFileMigration:
 		return f"{tmp_path}/test_migration.bskc"
 
 	@pytest.fixture
-	def storage_path(self):
+	def storage_path(self, request):
 		"""Return a test storage path."""
-		return UPath("memory://test_migration")
+		return UPath(f"memory://{request.node.name}")
 
 	def test_open_bskc_v0_file(self, ai_model, bskc_path, storage_path):
 		"""Test opening a v0 format BSKC file."""
@@ -3,6 +3,7 @@
 import json
 import os
 import zipfile
+from io import BytesIO
 
 import pytest
 from upath import UPath
@@ -19,6 +20,16 @@ from basilisk.conversation import (
 )
 
 
+@pytest.fixture(scope="module")
+def empty_bskc_bytes():
+	"""Return the content of a conversation file holding an empty conversation."""
+	buffer = BytesIO()
+	with zipfile.ZipFile(buffer, "w") as zip_file:
+		conv_data = {"messages": [], "systems": [], "title": None}
+		zip_file.writestr("conversation.json", json.dumps(conv_data))
+	return buffer.getvalue()
+
+
 class TestBasicSaveRestore:
 	"""Tests for basic conversation save and restore functionality."""
 
@@ -30,7 +41,7 @@ class TestBasicSaveRestore:
 	@pytest.fixture
 	def storage_path(self, request):
 		"""Return a test storage path."""
-		return UPath("memory://{request.node.name}")
+		return UPath(f"memory://{request.node.name}")
 
 	def test_save_empty_conversation(self, empty_conversation, bskc_path):
 		"""Test saving an empty conversation."""
@@ -50,14 +61,12 @@ class TestBasicSaveRestore:
 					"version": BSKC_VERSION,
 				}
 
-	def test_restore_empty_conversation(self, bskc_path, storage_path):
+	def test_restore_empty_conversation(
+		self, bskc_path, storage_path, empty_bskc_bytes
+	):
 		"""Test restoring an empty conversation."""
-		# Create a test conversation file
-		with zipfile.ZipFile(bskc_path, "w") as zip_file:
-			with zip_file.open("conversation.json", "w") as json_file:
-				conv_data = {"messages": [], "systems": [], "title": None}
-				conv_json = json.dumps(conv_data).encode("utf-8")
-				json_file.write(conv_json)
+		with open(bskc_path, "wb") as f:
+			f.write(empty_bskc_bytes)
 
 		restored_conversation = Conversation.open(bskc_path, storage_path)
 
@@ -133,17 +142,17 @@ class TestSystemMessageSaveRestore:
 	"""Tests for saving and restoring conversations with system messages."""
 
 	@pytest.fixture
-	def bskc_path(self, tmp_path):
-		"""Return a test conversation file path."""
-		return f"{tmp_path}{os.sep}test_conversation.bskc"
+	def bskc_file(self):
+		"""Return an in-memory test conversation file."""
+		return BytesIO()
 
 	@pytest.fixture
-	def storage_path(self):
+	def storage_path(self, request):
 		"""Return a test storage path."""
-		return UPath("memory://test_system_restore")
+		return UPath(f"memory://{request.node.name}")
 
 	def test_save_restore_with_system_messages(
-		self, empty_conversation, ai_model, bskc_path, storage_path
+		self, empty_conversation, ai_model, bskc_file, storage_path
 	):
 		"""Test saving and restoring a conversation with system messages."""
 		# Create system messages
@@ -166,8 +175,8 @@ class TestSystemMessageSaveRestore:
 		empty_conversation.add_block(block2, system2)
 
 		# Save and restore conversation
-		empty_conversation.save(bskc_path)
-		restored_conversation = Conversation.open(bskc_path, storage_path)
+		empty_conversation.save(bskc_file)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -182,7 +191,7 @@ class TestSystemMessageSaveRestore:
 		assert restored_conversation.messages[1].system_index == 1
 
 	def test_save_restore_with_shared_system_message(
-		self, empty_conversation, ai_model, bskc_path, storage_path
+		self, empty_conversation, ai_model, bskc_file, storage_path
 	):
 		"""Test saving and restoring a conversation with shared system messages."""
 		# Create shared system message
@@ -202,8 +211,8 @@ class TestSystemMessageSaveRestore:
 		empty_conversation.add_block(block2, system)
 
 		# Save and restore conversation
-		empty_conversation.save(bskc_path)
-		restored_conversation = Conversation.open(bskc_path, storage_path)
+		empty_conversation.save(bskc_file)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -220,19 +229,19 @@ class TestAttachmentSaveRestore:
 	"""Tests for saving and restoring conversations with attachments."""
 
 	@pytest.fixture
-	def bskc_path(self, tmp_path):
-		"""Return a test conversation file path."""
-		return f"{tmp_path}{os.sep}test_conversation.bskc"
+	def bskc_file(self):
+		"""Return an in-memory test conversation file."""
+		return BytesIO()
 
-	@pytest.fixture
+	@pytest.fixture(scope="class")
 	def text_content(self):
 		"""Return test text content."""
 		return "This is a test file content"
 
-	@pytest.fixture
-	def text_path(self, tmp_path, text_content):
-		"""Create and return a text file path."""
-		path = UPath(tmp_path) / "test_file.txt"
+	@pytest.fixture(scope="class")
+	def text_path(self, tmp_path_factory, text_content):
+		"""Create a text file shared by the tests of this class and return its path."""
+		path = UPath(tmp_path_factory.mktemp("text")) / "test_file.txt"
 		with path.open("w") as f:
 			f.write(text_content)
 		return path
@@ -249,7 +258,7 @@ class TestAttachmentSaveRestore:
 		return ImageFile(location=UPath(url))
 
 	def test_save_restore_with_image_attachment(
-		self, empty_conversation, ai_model, image_file, bskc_path
+		self, empty_conversation, ai_model, image_file, bskc_file
 	):
 		"""Test saving and restoring a conversation with image attachments."""
 		# Create image attachment
@@ -267,11 +276,11 @@ class TestAttachmentSaveRestore:
 		empty_conversation.add_block(block)
 
 		# Save conversation
-		empty_conversation.save(str(bskc_path))
+		empty_conversation.save(bskc_file)
 
 		# Restore conversation
 		storage_path = UPath("memory://test_image_restore")
-		restored_conversation = Conversation.open(str(bskc_path), storage_path)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -291,7 +300,7 @@ class TestAttachmentSaveRestore:
 		ai_model,
 		text_attachment,
 		text_content,
-		bskc_path,
+		bskc_file,
 	):
 		"""Test saving and restoring a conversation with text file attachments."""
 		# Create message with text attachment
@@ -306,11 +315,11 @@ class TestAttachmentSaveRestore:
 		empty_conversation.add_block(block)
 
 		# Save conversation
-		empty_conversation.save(str(bskc_path))
+		empty_conversation.save(bskc_file)
 
 		# Restore conversation
 		storage_path = UPath("memory://test_text_restore")
-		restored_conversation = Conversation.open(str(bskc_path), storage_path)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -330,7 +339,7 @@ class TestAttachmentSaveRestore:
 			assert content == text_content
 
 	def test_save_restore_with_url_attachment(
-		self, empty_conversation, ai_model, url_image, bskc_path
+		self, empty_conversation, ai_model, url_image, bskc_file
 	):
 		"""Test saving and restoring a conversation with URL attachments."""
 		# Create message with URL attachment
@@ -345,11 +354,11 @@ class TestAttachmentSaveRestore:
 		empty_conversation.add_block(block)
 
 		# Save conversation
-		empty_conversation.save(str(bskc_path))
+		empty_conversation.save(bskc_file)
 
 		# Restore conversation
 		storage_path = UPath("memory://test_url_restore")
-		restored_conversation = Conversation.open(str(bskc_path), storage_path)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -371,7 +380,7 @@ class TestAttachmentSaveRestore:
 		text_attachment,
 		image_attachment,
 		url_image,
-		bskc_path,
+		bskc_file,
 	):
 		"""Test saving and restoring a conversation with multiple attachments."""
 		# Create message with multiple attachments
@@ -386,11 +395,11 @@ class TestAttachmentSaveRestore:
 		empty_conversation.add_block(block)
 
 		# Save conversation
-		empty_conversation.save(str(bskc_path))
+		empty_conversation.save(bskc_file)
 
 		# Restore conversation
 		storage_path = UPath("memory://test_multiple_restore")
-		restored_conversation = Conversation.open(str(bskc_path), storage_path)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)
@@ -411,8 +420,41 @@ class TestAttachmentSaveRestore:
 			== "https://example.com/image.jpg"
 		)
 
+	def test_save_attachments_compression(
+		self,
+		empty_conversation,
+		ai_model,
+		text_attachment,
+		image_attachment,
+		bskc_file,
+	):
+		"""Test that text is compressed and images are stored as is."""
+		request = Message(
+			role=MessageRoleEnum.USER,
+			content="Test message with attachments",
+			attachments=[text_attachment, image_attachment],
+		)
+		block = MessageBlock(request=request, model=ai_model)
+		empty_conversation.add_block(block)
+
+		empty_conversation.save(bskc_file)
+
+		with zipfile.ZipFile(bskc_file, "r") as zip_file:
+			assert (
+				zip_file.getinfo("conversation.json").compress_type
+				== zipfile.ZIP_DEFLATED
+			)
+			assert (
+				zip_file.getinfo("attachments/test_file.txt").compress_type
+				== zipfile.ZIP_DEFLATED
+			)
+			assert (
+				zip_file.getinfo("attachments/test.png").compress_type
+				== zipfile.ZIP_STORED
+			)
+
 	def test_save_conversation_with_citations(
-		self, empty_conversation, ai_model, bskc_path
+		self, empty_conversation, ai_model, bskc_file
 	):
 		"""Test saving and restoring a conversation with citations."""
 		# Create citations
@@ -438,11 +480,11 @@ class TestAttachmentSaveRestore:
 		empty_conversation.add_block(block)
 
 		# Save conversation
-		empty_conversation.save(bskc_path)
+		empty_conversation.save(bskc_file)
 
 		# Restore conversation
 		storage_path = UPath("memory://test_citation_restore")
-		restored_conversation = Conversation.open(bskc_path, storage_path)
+		restored_conversation = Conversation.open(bskc_file, storage_path)
 
 		# Verify restored conversation
 		assert isinstance(restored_conversation, Conversation)